@@ -25,6 +25,7 @@ python3Packages.buildPythonApplication {
   propagatedBuildInputs = [
     clan-cli-module
     opentofu
+    python3Packages.orjson
     python3Packages.textual
   ];
 }
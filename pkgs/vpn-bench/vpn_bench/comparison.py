@@ -7,11 +7,19 @@ across machines, and writes aggregated comparison data for visualization.
 
 import json
 import logging
+import math
+import os
 import statistics
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Any, TypedDict
+from types import MappingProxyType
+from typing import Any, TypedDict, cast
 
 from vpn_bench.errors import save_bench_report
+from vpn_bench.jsonio import json_loads
 
 log = logging.getLogger(__name__)
 
@@ -376,21 +384,40 @@ TC_PROFILE_ORDER = [
     "medium_impairment",
     "high_impairment",
 ]
+TC_PROFILE_RANK = {profile: rank for rank, profile in enumerate(TC_PROFILE_ORDER)}
 
 
 def sort_tc_profiles(profiles: set[str]) -> list[str]:
     """Sort TC profiles in logical severity order (baseline -> low -> medium -> high)."""
 
     def sort_key(profile: str) -> tuple[int, str]:
-        try:
-            return (TC_PROFILE_ORDER.index(profile), profile)
-        except ValueError:
-            # Unknown profiles go at the end, sorted alphabetically
-            return (len(TC_PROFILE_ORDER), profile)
+        # Unknown profiles go at the end, sorted alphabetically
+        return (TC_PROFILE_RANK.get(profile, len(TC_PROFILE_ORDER)), profile)
 
     return sorted(profiles, key=sort_key)
 
 
+def single_value_stats(value: float) -> MetricStatsDict:
+    """Create a MetricStatsDict describing a single measured value."""
+    return {
+        "min": value,
+        "average": value,
+        "max": value,
+        "percentiles": {"p25": value, "p50": value, "p75": value},
+    }
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Return the value at fraction p of an ascending sequence, without interpolation.
+
+    Only used for the test duration stats; per-machine metric values are
+    interpolated by stats_from_values.
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[int(p * (len(sorted_values) - 1))]
+
+
 def aggregate_metric_stats(stats_list: list[MetricStatsDict]) -> MetricStatsDict:
     """
     Aggregate multiple MetricStatsDict into a single summary.
@@ -399,12 +426,7 @@ def aggregate_metric_stats(stats_list: list[MetricStatsDict]) -> MetricStatsDict
     and average of percentiles.
     """
     if not stats_list:
-        return {
-            "min": 0.0,
-            "average": 0.0,
-            "max": 0.0,
-            "percentiles": {"p25": 0.0, "p50": 0.0, "p75": 0.0},
-        }
+        return single_value_stats(0.0)
 
     mins = [s["min"] for s in stats_list]
     averages = [s["average"] for s in stats_list]
@@ -413,18 +435,67 @@ def aggregate_metric_stats(stats_list: list[MetricStatsDict]) -> MetricStatsDict
     p50s = [s["percentiles"]["p50"] for s in stats_list]
     p75s = [s["percentiles"]["p75"] for s in stats_list]
 
+    n = len(stats_list)
     return {
         "min": min(mins),
-        "average": statistics.mean(averages),
+        "average": sum(averages) / n,
         "max": max(maxes),
         "percentiles": {
-            "p25": statistics.mean(p25s),
-            "p50": statistics.mean(p50s),
-            "p75": statistics.mean(p75s),
+            "p25": sum(p25s) / n,
+            "p50": sum(p50s) / n,
+            "p75": sum(p75s) / n,
         },
     }
 
 
+def aggregate_metric_columns(
+    rows: Sequence[Mapping[str, Any]], keys: Sequence[str]
+) -> dict[str, MetricStatsDict]:
+    """Aggregate each metric in keys across rows, in one pass over the rows.
+
+    Rows that lack a metric are left out of that metric's aggregate.
+    """
+    columns: dict[str, list[MetricStatsDict]] = {key: [] for key in keys}
+    for row in rows:
+        for key, column in columns.items():
+            if key in row:
+                column.append(row[key])
+    return {key: aggregate_metric_stats(column) for key, column in columns.items()}
+
+
+def stats_from_values(values: Sequence[float]) -> MetricStatsDict:
+    """Summarize per-machine values of one metric as a MetricStatsDict.
+
+    The percentiles are linearly interpolated between the values, so p25/p75
+    describe the spread across the usual two to four machines instead of
+    collapsing onto min and median.
+    """
+    if not values:
+        return single_value_stats(0.0)
+    if len(values) == 1:
+        return single_value_stats(values[0])
+
+    ordered = sorted(values)
+    p25, p50, p75 = statistics.quantiles(ordered, n=4, method="inclusive")
+    return {
+        "min": ordered[0],
+        "average": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+        "percentiles": {"p25": p25, "p50": p50, "p75": p75},
+    }
+
+
+def aggregate_value_columns(
+    rows: Sequence[Mapping[str, float]], keys: Sequence[str]
+) -> dict[str, MetricStatsDict]:
+    """Summarize each metric in keys across rows of raw per-machine values.
+
+    Rows come from the extractors in this module, which always fill in every
+    key, so no per-row membership check is needed.
+    """
+    return {key: stats_from_values([row[key] for row in rows]) for key in keys}
+
+
 class LoadResult(TypedDict, total=False):
     """Result of loading a JSON file - can be success or error."""
 
@@ -434,37 +505,178 @@ class LoadResult(TypedDict, total=False):
     error: dict[str, Any]
 
 
-def load_json_data(file_path: Path) -> dict[str, Any] | None:
-    """Load JSON data from a file, returning None if it doesn't exist or fails."""
-    if not file_path.exists():
+@dataclass(frozen=True, eq=False)
+class RunDirListing:
+    """JSON files found below one VPN run directory, grouped by filename.
+
+    Listings are shared through the list_run_dir cache, so every field is
+    read-only. They compare and hash by identity.
+    """
+
+    run_dir: Path
+    machines: tuple[str, ...]  # Machine directory names, sorted
+    run_files: frozenset[str]  # JSON filenames directly inside run_dir
+    machine_files: Mapping[str, tuple[str, ...]]  # Filename -> machines, sorted
+
+    def run_file(self, filename: str) -> Path | None:
+        """Path of a run-level JSON file, or None if it is not present."""
+        if filename not in self.run_files:
+            return None
+        return self.run_dir / filename
+
+    def machine_paths(self, filename: str) -> list[Path]:
+        """Paths of every per-machine copy of filename, ordered by machine."""
+        return [
+            self.run_dir / machine / filename
+            for machine in self.machine_files.get(filename, ())
+        ]
+
+    def all_paths(self) -> list[Path]:
+        """Paths of every per-machine and run-level JSON file."""
+        paths: list[Path] = []
+        for filename in self.machine_files:
+            paths.extend(self.machine_paths(filename))
+        paths.extend(self.run_dir / filename for filename in self.run_files)
+        return paths
+
+
+@cache
+def list_run_dir(run_dir: Path) -> RunDirListing | None:
+    """List a ``<bench_dir>/<vpn>/<run_alias>`` directory, or None if it is missing.
+
+    Every aggregator and error lookup of a VPN run shares this listing, so the
+    directory tree is only walked once per comparison generation. The walk only
+    handles names; Paths are built for the files that are actually read.
+    """
+    try:
+        with os.scandir(run_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
+    # DirEntry.is_dir()/is_file() use the file type returned by the directory
+    # read itself, so classifying entries costs no extra stat calls
+    machines: list[str] = []
+    run_files: set[str] = set()
+    machine_files: dict[str, list[str]] = {}
+    for entry in entries:
+        if entry.is_dir():
+            machines.append(entry.name)
+            with os.scandir(entry.path) as machine_it:
+                for e in machine_it:
+                    if e.name.endswith(".json") and e.is_file():
+                        machine_files.setdefault(e.name, []).append(entry.name)
+        elif entry.name.endswith(".json") and entry.is_file():
+            run_files.add(entry.name)
+
+    return RunDirListing(
+        run_dir=run_dir,
+        machines=tuple(machines),
+        run_files=frozenset(run_files),
+        machine_files=MappingProxyType(
+            {name: tuple(holders) for name, holders in machine_files.items()}
+        ),
+    )
+
+
+@cache
+def _parse_json_file(file_path: Path, mtime_ns: int, size: int) -> Any:
+    """Decode a JSON file once per modification time and size.
+
+    Keying on the size as well catches rewrites that land within the
+    filesystem's timestamp granularity.
+
+    The returned objects are shared between callers and must not be mutated.
+    """
+    return json_loads(file_path.read_bytes())
+
+
+def read_json_file(file_path: Path) -> Any:
+    """Decode a JSON file through the parse cache.
+
+    Raises OSError or json.JSONDecodeError like a direct read would.
+    """
+    stat = file_path.stat()
+    return _parse_json_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_caches() -> None:
+    """Drop cached directory listings, decoded JSON files, aggregates and errors."""
+    list_run_dir.cache_clear()
+    _parse_json_file.cache_clear()
+    get_vpn_error_for_test.cache_clear()
+    get_vpn_error_for_run_level_test.cache_clear()
+    aggregate_ping_data.cache_clear()
+    aggregate_qperf_data.cache_clear()
+    aggregate_rist_data.cache_clear()
+    aggregate_tcp_iperf_data.cache_clear()
+    aggregate_udp_iperf_data.cache_clear()
+    aggregate_nix_cache_data.cache_clear()
+    aggregate_parallel_tcp_data.cache_clear()
+    load_timing_breakdown.cache_clear()
+    extract_tc_stabilization_time.cache_clear()
+    extract_test_metadata_timings.cache_clear()
+
+
+def preload_run_dir(run_dir: Path) -> None:
+    """Read and decode every JSON file of a VPN run into the parse cache.
+
+    The aggregators of the individual tests then find their files already
+    decoded. Unreadable files are skipped here and reported by the loaders.
+    """
+    listing = list_run_dir(run_dir)
+    if listing is None:
+        return
+    for file_path in listing.all_paths():
+        try:
+            read_json_file(file_path)
+        except (json.JSONDecodeError, OSError):
+            continue
+
+
+def load_json_data(file_path: Path) -> dict[str, Any] | None:
+    """Load JSON data from a file, returning None if it doesn't exist or fails."""
     try:
-        with file_path.open("r") as f:
-            data = json.load(f)
-            if data.get("status") == "success":
-                return data.get("data")
-            log.debug(f"Skipping failed benchmark: {file_path}")
-            return None
+        data = read_json_file(file_path)
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, OSError) as e:
         log.warning(f"Failed to load {file_path}: {e}")
         return None
 
+    if data.get("status") == "success":
+        return data.get("data")
+    log.debug(f"Skipping failed benchmark: {file_path}")
+    return None
+
 
 def load_json_with_errors(file_path: Path) -> LoadResult | None:
     """Load JSON data including error information, returning None if file doesn't exist."""
-    if not file_path.exists():
-        return None
-
     try:
-        with file_path.open("r") as f:
-            data = json.load(f)
-            return data
+        return read_json_file(file_path)
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, OSError) as e:
         log.warning(f"Failed to load {file_path}: {e}")
         return None
 
 
+def load_machine_results(
+    bench_dir: Path, vpn_name: str, run_alias: str, filename: str
+) -> list[dict[str, Any]]:
+    """Load the successful per-machine results of one test, ordered by machine."""
+    listing = list_run_dir(bench_dir / vpn_name / run_alias)
+    if listing is None:
+        return []
+
+    results: list[dict[str, Any]] = []
+    for file_path in listing.machine_paths(filename):
+        data = load_json_data(file_path)
+        if data:
+            results.append(data)
+    return results
+
+
 def check_duration_consistency(
     comparison_data: dict[str, Any], test_name: str, tolerance: float = 1.0
 ) -> None:
@@ -477,41 +689,43 @@ def check_duration_consistency(
         test_name: Name of the test for logging
         tolerance: Maximum allowed difference in seconds
     """
-    durations: list[float] = []
-    for _vpn_name, vpn_data in comparison_data.items():
+    min_dur, max_dur = math.inf, -math.inf
+    count = 0
+    for vpn_data in comparison_data.values():
         if vpn_data.get("status") == "success":
             duration = vpn_data["data"].get("duration_seconds", {}).get("average", 0)
             if duration > 0:
-                durations.append(duration)
-
-    if len(durations) >= 2:
-        min_dur, max_dur = min(durations), max(durations)
-        if max_dur - min_dur > tolerance:
-            log.warning(
-                f"Duration mismatch in {test_name}: min={min_dur:.2f}s, max={max_dur:.2f}s "
-                f"(tolerance={tolerance}s). This may indicate inconsistent test configurations."
-            )
+                min_dur = min(min_dur, duration)
+                max_dur = max(max_dur, duration)
+                count += 1
+
+    if count >= 2 and max_dur - min_dur > tolerance:
+        log.warning(
+            f"Duration mismatch in {test_name}: min={min_dur:.2f}s, max={max_dur:.2f}s "
+            f"(tolerance={tolerance}s). This may indicate inconsistent test configurations."
+        )
 
 
+@cache
 def get_vpn_error_for_test(
     bench_dir: Path, vpn_name: str, run_alias: str, test_file: str
 ) -> dict[str, Any] | None:
-    """Get the first error found for a VPN's test across its machines."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
-        return None
+    """Get the first error found for a VPN's test across its machines.
 
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
+    Cached because the cross-profile generators look up the same errors again
+    after the per-run comparisons; the result must not be mutated.
+    """
+    listing = list_run_dir(bench_dir / vpn_name / run_alias)
+    if listing is None:
+        return None
 
-        test_path = machine_dir / test_file
+    for test_path in listing.machine_paths(test_file):
         result = load_json_with_errors(test_path)
         if result and result.get("status") == "error":
             return {
                 "error_type": result.get("error_type", "Unknown"),
                 "error": result.get("error", {}),
-                "machine": machine_dir.name,
+                "machine": test_path.parent.name,
             }
 
     return None
@@ -555,13 +769,11 @@ def extract_hardware_from_facter(
     Returns:
         MachineHardwareDict with extracted hardware info, or None if extraction fails
     """
-    if not facter_path.exists():
+    try:
+        facter_data = json_loads(facter_path.read_bytes())
+    except FileNotFoundError:
         log.warning(f"Facter file not found: {facter_path}")
         return None
-
-    try:
-        with facter_path.open("r") as f:
-            facter_data = json.load(f)
     except (json.JSONDecodeError, OSError) as e:
         log.warning(f"Failed to load facter file {facter_path}: {e}")
         return None
@@ -680,17 +892,17 @@ def generate_hardware_comparison(clan_dir: Path) -> HardwareComparisonDict | Non
         HardwareComparisonDict with all machine hardware info
     """
     machines_path = clan_dir / "machines"
-    if not machines_path.exists():
+    try:
+        with os.scandir(machines_path) as it:
+            machine_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
         log.warning(f"Machines directory not found: {machines_path}")
         return None
 
     hardware_data: list[MachineHardwareDict] = []
 
-    for machine_dir in sorted(machines_path.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        facter_path = machine_dir / "facter.json"
+    for machine_dir in machine_dirs:
+        facter_path = Path(machine_dir.path) / "facter.json"
         machine_hw = extract_hardware_from_facter(facter_path, machine_dir.name)
         if machine_hw:
             hardware_data.append(machine_hw)
@@ -704,153 +916,115 @@ def generate_hardware_comparison(clan_dir: Path) -> HardwareComparisonDict | Non
 
 # --- Aggregation Functions ---
 
+# The aggregate_*_data functions are cached per (bench_dir, vpn, run alias), so
+# the cross-profile generators reuse the results of the per-run comparisons.
+# Their results are shared and must not be mutated.
+
+PING_METRIC_KEYS = (
+    "rtt_min_ms",
+    "rtt_avg_ms",
+    "rtt_max_ms",
+    "rtt_mdev_ms",
+    "packet_loss_percent",
+)
 
+
+@cache
 def aggregate_ping_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> PingComparisonDict | None:
     """Aggregate ping data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
+    stats_list = load_machine_results(bench_dir, vpn_name, run_alias, "ping.json")
+    if not stats_list:
         return None
 
-    stats_list: list[dict[str, MetricStatsDict]] = []
-
-    # Find all machine directories
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        ping_file = machine_dir / "ping.json"
-        data = load_json_data(ping_file)
-        if data:
-            stats_list.append(data)
+    return cast(
+        PingComparisonDict, aggregate_metric_columns(stats_list, PING_METRIC_KEYS)
+    )
 
-    if not stats_list:
-        return None
 
-    return {
-        "rtt_min_ms": aggregate_metric_stats(
-            [s["rtt_min_ms"] for s in stats_list if "rtt_min_ms" in s]
-        ),
-        "rtt_avg_ms": aggregate_metric_stats(
-            [s["rtt_avg_ms"] for s in stats_list if "rtt_avg_ms" in s]
-        ),
-        "rtt_max_ms": aggregate_metric_stats(
-            [s["rtt_max_ms"] for s in stats_list if "rtt_max_ms" in s]
-        ),
-        "rtt_mdev_ms": aggregate_metric_stats(
-            [s["rtt_mdev_ms"] for s in stats_list if "rtt_mdev_ms" in s]
-        ),
-        "packet_loss_percent": aggregate_metric_stats(
-            [s["packet_loss_percent"] for s in stats_list if "packet_loss_percent" in s]
-        ),
-    }
+QPERF_METRIC_KEYS = (
+    "total_bandwidth_mbps",
+    "cpu_usage_percent",
+    "ttfb_ms",
+    "conn_time_ms",
+)
 
 
+@cache
 def aggregate_qperf_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> QperfComparisonDict | None:
     """Aggregate qperf data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
+    stats_list = load_machine_results(bench_dir, vpn_name, run_alias, "qperf.json")
+    if not stats_list:
         return None
 
-    stats_list: list[dict[str, MetricStatsDict]] = []
-
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
+    return cast(
+        QperfComparisonDict, aggregate_metric_columns(stats_list, QPERF_METRIC_KEYS)
+    )
 
-        qperf_file = machine_dir / "qperf.json"
-        data = load_json_data(qperf_file)
-        if data:
-            stats_list.append(data)
 
-    if not stats_list:
-        return None
-
-    return {
-        "total_bandwidth_mbps": aggregate_metric_stats(
-            [
-                s["total_bandwidth_mbps"]
-                for s in stats_list
-                if "total_bandwidth_mbps" in s
-            ]
-        ),
-        "cpu_usage_percent": aggregate_metric_stats(
-            [s["cpu_usage_percent"] for s in stats_list if "cpu_usage_percent" in s]
-        ),
-        "ttfb_ms": aggregate_metric_stats(
-            [s["ttfb_ms"] for s in stats_list if "ttfb_ms" in s]
-        ),
-        "conn_time_ms": aggregate_metric_stats(
-            [s["conn_time_ms"] for s in stats_list if "conn_time_ms" in s]
-        ),
-    }
+RIST_ENCODING_METRIC_KEYS = (
+    "bitrate_kbps",
+    "fps",
+    "dropped_frames",
+)
+RIST_NETWORK_METRIC_KEYS = (
+    "quality",
+    "rtt_ms",
+    "packets_recovered",
+    "packets_dropped",
+)
 
 
+@cache
 def aggregate_rist_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> RistComparisonDict | None:
     """Aggregate RIST streaming data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
-        return None
-
     encoding_stats_list: list[dict[str, MetricStatsDict]] = []
     network_stats_list: list[dict[str, MetricStatsDict]] = []
 
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        rist_file = machine_dir / "rist_stream.json"
-        data = load_json_data(rist_file)
-        if data:
-            # Extract encoding stats (static metrics for metadata)
-            encoding = data.get("encoding", {})
-            if encoding:
-                encoding_stats_list.append(encoding)
-            # Extract network stats (dynamic metrics for plots)
-            network = data.get("network", {})
-            if network:
-                network_stats_list.append(network)
+    for data in load_machine_results(
+        bench_dir, vpn_name, run_alias, "rist_stream.json"
+    ):
+        # Extract encoding stats (static metrics for metadata)
+        encoding = data.get("encoding", {})
+        if encoding:
+            encoding_stats_list.append(encoding)
+        # Extract network stats (dynamic metrics for plots)
+        network = data.get("network", {})
+        if network:
+            network_stats_list.append(network)
 
     if not encoding_stats_list and not network_stats_list:
         return None
 
-    return {
-        # Static encoding metrics (for metadata display)
-        "bitrate_kbps": aggregate_metric_stats(
-            [s["bitrate_kbps"] for s in encoding_stats_list if "bitrate_kbps" in s]
-        ),
-        "fps": aggregate_metric_stats(
-            [s["fps"] for s in encoding_stats_list if "fps" in s]
-        ),
-        "dropped_frames": aggregate_metric_stats(
-            [s["dropped_frames"] for s in encoding_stats_list if "dropped_frames" in s]
-        ),
-        # Dynamic network metrics (for plots)
-        "quality": aggregate_metric_stats(
-            [s["quality"] for s in network_stats_list if "quality" in s]
-        ),
-        "rtt_ms": aggregate_metric_stats(
-            [s["rtt_ms"] for s in network_stats_list if "rtt_ms" in s]
-        ),
-        "packets_recovered": aggregate_metric_stats(
-            [
-                s["packets_recovered"]
-                for s in network_stats_list
-                if "packets_recovered" in s
-            ]
-        ),
-        "packets_dropped": aggregate_metric_stats(
-            [s["packets_dropped"] for s in network_stats_list if "packets_dropped" in s]
-        ),
-    }
+    return cast(
+        RistComparisonDict,
+        {
+            # Static encoding metrics (for metadata display)
+            **aggregate_metric_columns(encoding_stats_list, RIST_ENCODING_METRIC_KEYS),
+            # Dynamic network metrics (for plots)
+            **aggregate_metric_columns(network_stats_list, RIST_NETWORK_METRIC_KEYS),
+        },
+    )
+
 
+def sender_streams(end: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the sender-side stats of an iperf3 end block's streams.
 
-def extract_tcp_iperf_metrics(data: dict[str, Any]) -> TcpIperfComparisonDict | None:
+    Only the sender side carries the congestion and send window sizes.
+    """
+    return [
+        sender_data
+        for stream in end.get("streams", [])
+        if (sender_data := stream.get("sender", {})).get("sender", False)
+    ]
+
+
+def extract_tcp_iperf_metrics(data: dict[str, Any]) -> dict[str, float] | None:
     """Extract key metrics from iperf3 TCP JSON output."""
     try:
         start = data.get("start", {})
@@ -875,97 +1049,64 @@ def extract_tcp_iperf_metrics(data: dict[str, Any]) -> TcpIperfComparisonDict |
         duration_seconds = sum_sent.get("seconds", 0)
 
         # Extract max window sizes from streams (sender stream has window data)
-        max_snd_cwnd = 0
-        max_snd_wnd = 0
-        streams = end.get("streams", [])
-        for stream in streams:
-            sender_data = stream.get("sender", {})
-            if sender_data.get("sender", False):  # This is the sender stream
-                max_snd_cwnd = max(max_snd_cwnd, sender_data.get("max_snd_cwnd", 0))
-                max_snd_wnd = max(max_snd_wnd, sender_data.get("max_snd_wnd", 0))
+        senders = sender_streams(end)
+        max_snd_cwnd = max((s.get("max_snd_cwnd", 0) for s in senders), default=0)
+        max_snd_wnd = max((s.get("max_snd_wnd", 0) for s in senders), default=0)
 
         # Calculate retransmit percentage using actual MSS from iperf3
         retransmit_pct = calculate_retransmit_percent(retransmits, bytes_sent, tcp_mss)
 
-        # Create MetricStatsDict for single values
-        def single_value_stats(value: float) -> MetricStatsDict:
-            return {
-                "min": value,
-                "average": value,
-                "max": value,
-                "percentiles": {"p25": value, "p50": value, "p75": value},
-            }
-
         return {
-            "sender_throughput_mbps": single_value_stats(sender_mbps),
-            "receiver_throughput_mbps": single_value_stats(receiver_mbps),
-            "retransmits": single_value_stats(float(retransmits)),
-            "retransmit_percent": single_value_stats(retransmit_pct),
-            "max_snd_cwnd_bytes": single_value_stats(float(max_snd_cwnd)),
-            "max_snd_wnd_bytes": single_value_stats(float(max_snd_wnd)),
-            "total_bytes_sent": single_value_stats(float(bytes_sent)),
-            "total_bytes_received": single_value_stats(float(bytes_received)),
-            "duration_seconds": single_value_stats(float(duration_seconds)),
+            "sender_throughput_mbps": sender_mbps,
+            "receiver_throughput_mbps": receiver_mbps,
+            "retransmits": float(retransmits),
+            "retransmit_percent": retransmit_pct,
+            "max_snd_cwnd_bytes": float(max_snd_cwnd),
+            "max_snd_wnd_bytes": float(max_snd_wnd),
+            "total_bytes_sent": float(bytes_sent),
+            "total_bytes_received": float(bytes_received),
+            "duration_seconds": float(duration_seconds),
         }
     except (KeyError, TypeError) as e:
         log.warning(f"Failed to extract TCP iperf metrics: {e}")
         return None
 
 
+TCP_IPERF_METRIC_KEYS = (
+    "sender_throughput_mbps",
+    "receiver_throughput_mbps",
+    "retransmits",
+    "retransmit_percent",
+    "max_snd_cwnd_bytes",
+    "max_snd_wnd_bytes",
+    "total_bytes_sent",
+    "total_bytes_received",
+    "duration_seconds",
+)
+
+
+@cache
 def aggregate_tcp_iperf_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> TcpIperfComparisonDict | None:
     """Aggregate TCP iperf3 data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
-        return None
-
-    metrics_list: list[TcpIperfComparisonDict] = []
+    metrics_list: list[dict[str, float]] = []
 
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        iperf_file = machine_dir / "tcp_iperf3.json"
-        data = load_json_data(iperf_file)
-        if data:
-            metrics = extract_tcp_iperf_metrics(data)
-            if metrics:
-                metrics_list.append(metrics)
+    for data in load_machine_results(bench_dir, vpn_name, run_alias, "tcp_iperf3.json"):
+        metrics = extract_tcp_iperf_metrics(data)
+        if metrics:
+            metrics_list.append(metrics)
 
     if not metrics_list:
         return None
 
-    return {
-        "sender_throughput_mbps": aggregate_metric_stats(
-            [m["sender_throughput_mbps"] for m in metrics_list]
-        ),
-        "receiver_throughput_mbps": aggregate_metric_stats(
-            [m["receiver_throughput_mbps"] for m in metrics_list]
-        ),
-        "retransmits": aggregate_metric_stats([m["retransmits"] for m in metrics_list]),
-        "retransmit_percent": aggregate_metric_stats(
-            [m["retransmit_percent"] for m in metrics_list]
-        ),
-        "max_snd_cwnd_bytes": aggregate_metric_stats(
-            [m["max_snd_cwnd_bytes"] for m in metrics_list]
-        ),
-        "max_snd_wnd_bytes": aggregate_metric_stats(
-            [m["max_snd_wnd_bytes"] for m in metrics_list]
-        ),
-        "total_bytes_sent": aggregate_metric_stats(
-            [m["total_bytes_sent"] for m in metrics_list]
-        ),
-        "total_bytes_received": aggregate_metric_stats(
-            [m["total_bytes_received"] for m in metrics_list]
-        ),
-        "duration_seconds": aggregate_metric_stats(
-            [m["duration_seconds"] for m in metrics_list]
-        ),
-    }
+    return cast(
+        TcpIperfComparisonDict,
+        aggregate_value_columns(metrics_list, TCP_IPERF_METRIC_KEYS),
+    )
 
 
-def extract_udp_iperf_metrics(data: dict[str, Any]) -> UdpIperfComparisonDict | None:
+def extract_udp_iperf_metrics(data: dict[str, Any]) -> dict[str, float] | None:
     """Extract key metrics from iperf3 UDP JSON output.
 
     For bidirectional UDP tests, we extract:
@@ -1008,154 +1149,107 @@ def extract_udp_iperf_metrics(data: dict[str, Any]) -> UdpIperfComparisonDict |
         host_cpu = cpu_util.get("host_total", 0)
         remote_cpu = cpu_util.get("remote_total", 0)
 
-        def single_value_stats(value: float) -> MetricStatsDict:
-            return {
-                "min": value,
-                "average": value,
-                "max": value,
-                "percentiles": {"p25": value, "p50": value, "p75": value},
-            }
-
         return {
-            "sender_throughput_mbps": single_value_stats(sender_mbps),
-            "receiver_throughput_mbps": single_value_stats(receiver_mbps),
-            "jitter_ms": single_value_stats(jitter_ms),
-            "lost_percent": single_value_stats(lost_percent),
-            "total_bytes_sent": single_value_stats(float(bytes_sent)),
-            "total_bytes_received": single_value_stats(float(bytes_received)),
-            "duration_seconds": single_value_stats(float(duration_seconds)),
-            "blksize_bytes": single_value_stats(float(blksize)),
-            "host_cpu_percent": single_value_stats(float(host_cpu)),
-            "remote_cpu_percent": single_value_stats(float(remote_cpu)),
+            "sender_throughput_mbps": sender_mbps,
+            "receiver_throughput_mbps": receiver_mbps,
+            "jitter_ms": jitter_ms,
+            "lost_percent": lost_percent,
+            "total_bytes_sent": float(bytes_sent),
+            "total_bytes_received": float(bytes_received),
+            "duration_seconds": float(duration_seconds),
+            "blksize_bytes": float(blksize),
+            "host_cpu_percent": float(host_cpu),
+            "remote_cpu_percent": float(remote_cpu),
         }
     except (KeyError, TypeError) as e:
         log.warning(f"Failed to extract UDP iperf metrics: {e}")
         return None
 
 
+UDP_IPERF_METRIC_KEYS = (
+    "sender_throughput_mbps",
+    "receiver_throughput_mbps",
+    "jitter_ms",
+    "lost_percent",
+    "total_bytes_sent",
+    "total_bytes_received",
+    "duration_seconds",
+    "blksize_bytes",
+    "host_cpu_percent",
+    "remote_cpu_percent",
+)
+
+
+@cache
 def aggregate_udp_iperf_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> UdpIperfComparisonDict | None:
     """Aggregate UDP iperf3 data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
-        return None
-
-    metrics_list: list[UdpIperfComparisonDict] = []
+    metrics_list: list[dict[str, float]] = []
 
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        iperf_file = machine_dir / "udp_iperf3.json"
-        data = load_json_data(iperf_file)
-        if data:
-            metrics = extract_udp_iperf_metrics(data)
-            if metrics:
-                metrics_list.append(metrics)
+    for data in load_machine_results(bench_dir, vpn_name, run_alias, "udp_iperf3.json"):
+        metrics = extract_udp_iperf_metrics(data)
+        if metrics:
+            metrics_list.append(metrics)
 
     if not metrics_list:
         return None
 
-    return {
-        "sender_throughput_mbps": aggregate_metric_stats(
-            [m["sender_throughput_mbps"] for m in metrics_list]
-        ),
-        "receiver_throughput_mbps": aggregate_metric_stats(
-            [m["receiver_throughput_mbps"] for m in metrics_list]
-        ),
-        "jitter_ms": aggregate_metric_stats([m["jitter_ms"] for m in metrics_list]),
-        "lost_percent": aggregate_metric_stats(
-            [m["lost_percent"] for m in metrics_list]
-        ),
-        "total_bytes_sent": aggregate_metric_stats(
-            [m["total_bytes_sent"] for m in metrics_list]
-        ),
-        "total_bytes_received": aggregate_metric_stats(
-            [m["total_bytes_received"] for m in metrics_list]
-        ),
-        "duration_seconds": aggregate_metric_stats(
-            [m["duration_seconds"] for m in metrics_list]
-        ),
-        "blksize_bytes": aggregate_metric_stats(
-            [m["blksize_bytes"] for m in metrics_list]
-        ),
-        "host_cpu_percent": aggregate_metric_stats(
-            [m["host_cpu_percent"] for m in metrics_list]
-        ),
-        "remote_cpu_percent": aggregate_metric_stats(
-            [m["remote_cpu_percent"] for m in metrics_list]
-        ),
-    }
+    return cast(
+        UdpIperfComparisonDict,
+        aggregate_value_columns(metrics_list, UDP_IPERF_METRIC_KEYS),
+    )
 
 
-def extract_nix_cache_metrics(data: dict[str, Any]) -> NixCacheComparisonDict | None:
+def extract_nix_cache_metrics(data: dict[str, Any]) -> dict[str, float] | None:
     """Extract key metrics from hyperfine JSON output (Nix Cache benchmark)."""
-    try:
-        results = data.get("results", [])
-        if not results:
-            return None
+    results = data.get("results", [])
+    if not results:
+        return None
 
-        result = results[0]  # Typically one result per benchmark
+    result = results[0] if isinstance(results, list) else None
+    if not isinstance(result, dict):
+        log.warning(
+            "Failed to extract Nix Cache metrics: results is not a list of objects"
+        )
+        return None
 
-        mean = result.get("mean", 0)
-        stddev = result.get("stddev", 0)
-        min_val = result.get("min", 0)
-        max_val = result.get("max", 0)
+    # Typically one result per benchmark
+    return {
+        "mean_seconds": result.get("mean", 0),
+        "stddev_seconds": result.get("stddev", 0),
+        "min_seconds": result.get("min", 0),
+        "max_seconds": result.get("max", 0),
+    }
 
-        def single_value_stats(value: float) -> MetricStatsDict:
-            return {
-                "min": value,
-                "average": value,
-                "max": value,
-                "percentiles": {"p25": value, "p50": value, "p75": value},
-            }
 
-        return {
-            "mean_seconds": single_value_stats(mean),
-            "stddev_seconds": single_value_stats(stddev),
-            "min_seconds": single_value_stats(min_val),
-            "max_seconds": single_value_stats(max_val),
-        }
-    except (KeyError, TypeError, IndexError) as e:
-        log.warning(f"Failed to extract Nix Cache metrics: {e}")
-        return None
+NIX_CACHE_METRIC_KEYS = (
+    "mean_seconds",
+    "stddev_seconds",
+    "min_seconds",
+    "max_seconds",
+)
 
 
+@cache
 def aggregate_nix_cache_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> NixCacheComparisonDict | None:
     """Aggregate Nix Cache data across all machines for a VPN."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
-        return None
-
-    metrics_list: list[NixCacheComparisonDict] = []
+    metrics_list: list[dict[str, float]] = []
 
-    for machine_dir in sorted(vpn_dir.iterdir()):
-        if not machine_dir.is_dir():
-            continue
-
-        nix_cache_file = machine_dir / "nix_cache.json"
-        data = load_json_data(nix_cache_file)
-        if data:
-            metrics = extract_nix_cache_metrics(data)
-            if metrics:
-                metrics_list.append(metrics)
+    for data in load_machine_results(bench_dir, vpn_name, run_alias, "nix_cache.json"):
+        metrics = extract_nix_cache_metrics(data)
+        if metrics:
+            metrics_list.append(metrics)
 
     if not metrics_list:
         return None
 
-    return {
-        "mean_seconds": aggregate_metric_stats(
-            [m["mean_seconds"] for m in metrics_list]
-        ),
-        "stddev_seconds": aggregate_metric_stats(
-            [m["stddev_seconds"] for m in metrics_list]
-        ),
-        "min_seconds": aggregate_metric_stats([m["min_seconds"] for m in metrics_list]),
-        "max_seconds": aggregate_metric_stats([m["max_seconds"] for m in metrics_list]),
-    }
+    return cast(
+        NixCacheComparisonDict,
+        aggregate_value_columns(metrics_list, NIX_CACHE_METRIC_KEYS),
+    )
 
 
 def extract_parallel_tcp_metrics(
@@ -1181,8 +1275,7 @@ def extract_parallel_tcp_metrics(
         total_sender_throughput = 0.0
         total_receiver_throughput = 0.0
         total_retransmits = 0
-        max_snd_cwnd = 0
-        max_snd_wnd = 0
+        senders: list[dict[str, Any]] = []
         total_bytes_sent = 0
         total_bytes_received = 0
         duration_seconds = 0.0  # Use duration from first successful pair
@@ -1213,13 +1306,8 @@ def extract_parallel_tcp_metrics(
                 duration_seconds = sum_sent.get("seconds", 0)
                 tcp_mss = start.get("tcp_mss_default")
 
-            # Extract max window sizes from streams
-            streams = end.get("streams", [])
-            for stream in streams:
-                sender_data = stream.get("sender", {})
-                if sender_data.get("sender", False):  # This is the sender stream
-                    max_snd_cwnd = max(max_snd_cwnd, sender_data.get("max_snd_cwnd", 0))
-                    max_snd_wnd = max(max_snd_wnd, sender_data.get("max_snd_wnd", 0))
+            # Collect sender streams for the window sizes
+            senders.extend(sender_streams(end))
 
             total_sender_throughput += sender_bps / 1_000_000
             total_receiver_throughput += receiver_bps / 1_000_000
@@ -1231,19 +1319,14 @@ def extract_parallel_tcp_metrics(
         if successful_pairs == 0:
             return None
 
+        max_snd_cwnd = max((s.get("max_snd_cwnd", 0) for s in senders), default=0)
+        max_snd_wnd = max((s.get("max_snd_wnd", 0) for s in senders), default=0)
+
         # Calculate retransmit percentage using actual MSS from iperf3
         retransmit_pct = calculate_retransmit_percent(
             total_retransmits, total_bytes_sent, tcp_mss
         )
 
-        def single_value_stats(value: float) -> MetricStatsDict:
-            return {
-                "min": value,
-                "average": value,
-                "max": value,
-                "percentiles": {"p25": value, "p50": value, "p75": value},
-            }
-
         return {
             "sender_throughput_mbps": single_value_stats(total_sender_throughput),
             "receiver_throughput_mbps": single_value_stats(total_receiver_throughput),
@@ -1260,6 +1343,7 @@ def extract_parallel_tcp_metrics(
         return None
 
 
+@cache
 def aggregate_parallel_tcp_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> ParallelTcpComparisonDict | None:
@@ -1267,11 +1351,14 @@ def aggregate_parallel_tcp_data(
 
     Note: Parallel TCP is stored at the run level, not per-machine.
     """
-    vpn_dir = bench_dir / vpn_name / run_alias
-    if not vpn_dir.exists():
+    listing = list_run_dir(bench_dir / vpn_name / run_alias)
+    if listing is None:
+        return None
+
+    parallel_tcp_file = listing.run_file("parallel_tcp_iperf3.json")
+    if parallel_tcp_file is None:
         return None
 
-    parallel_tcp_file = vpn_dir / "parallel_tcp_iperf3.json"
     data = load_json_data(parallel_tcp_file)
     if data:
         return extract_parallel_tcp_metrics(data)
@@ -1279,12 +1366,21 @@ def aggregate_parallel_tcp_data(
     return None
 
 
+@cache
 def get_vpn_error_for_run_level_test(
     bench_dir: Path, vpn_name: str, run_alias: str, test_file: str
 ) -> dict[str, Any] | None:
-    """Get error for a run-level test (not per-machine)."""
-    vpn_dir = bench_dir / vpn_name / run_alias
-    test_path = vpn_dir / test_file
+    """Get error for a run-level test (not per-machine).
+
+    Cached like get_vpn_error_for_test.
+    """
+    listing = list_run_dir(bench_dir / vpn_name / run_alias)
+    if listing is None:
+        return None
+
+    test_path = listing.run_file(test_file)
+    if test_path is None:
+        return None
 
     result = load_json_with_errors(test_path)
     if result and result.get("status") == "error":
@@ -1297,6 +1393,31 @@ def get_vpn_error_for_run_level_test(
     return None
 
 
+@cache
+def load_timing_breakdown(
+    bench_dir: Path, vpn_name: str, run_alias: str
+) -> dict[str, Any] | None:
+    """Load the timing_breakdown.json that applies to a VPN run, or None.
+
+    The run_alias specific file is tried first, then the one at the VPN root
+    (for baseline). The lookup is cached because the timing aggregation and the
+    time breakdown both need it; the result must not be mutated.
+    """
+    vpn_dir = bench_dir / vpn_name
+    for timing_file in (
+        vpn_dir / run_alias / "timing_breakdown.json",
+        vpn_dir / "timing_breakdown.json",
+    ):
+        try:
+            return read_json_file(timing_file)
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, OSError) as e:
+            log.warning(f"Failed to load timing data from {timing_file}: {e}")
+            return None
+    return None
+
+
 def aggregate_timing_data(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> TimingComparisonDict | None:
@@ -1306,25 +1427,19 @@ def aggregate_timing_data(
     when VPNs are run separately), we calculate it from component timings derived
     from individual test metadata files that persist across runs.
     """
-    vpn_dir = bench_dir / vpn_name
+    # Get installation time from timing_breakdown.json (stable, written once per VPN deploy)
+    timing = load_timing_breakdown(bench_dir, vpn_name, run_alias)
 
-    # Try run_alias specific path first, then VPN root (for baseline)
-    timing_file = vpn_dir / run_alias / "timing_breakdown.json"
-    if not timing_file.exists():
-        timing_file = vpn_dir / "timing_breakdown.json"
+    # Nothing to report without a timing file or any test results
+    if timing is None and list_run_dir(bench_dir / vpn_name / run_alias) is None:
+        return None
 
-    # Get installation time from timing_breakdown.json (stable, written once per VPN deploy)
     installation = 0.0
-    if timing_file.exists():
-        try:
-            with timing_file.open() as f:
-                data = json.load(f)
-            for phase in data.get("phases", []):
-                if phase.get("phase") == "vpn_installation":
-                    installation = phase.get("duration_seconds", 0)
-                    break
-        except (json.JSONDecodeError, OSError) as e:
-            log.warning(f"Failed to load timing data from {timing_file}: {e}")
+    if timing is not None:
+        for phase in timing.get("phases", []):
+            if phase.get("phase") == "vpn_installation":
+                installation = phase.get("duration_seconds", 0)
+                break
 
     # Get component timings from test metadata (accumulates correctly across runs)
     tc_stab = extract_tc_stabilization_time(bench_dir, vpn_name, run_alias)
@@ -1342,91 +1457,75 @@ def aggregate_timing_data(
     if total == 0.0 and installation == 0.0 and benchmarking == 0.0:
         return None
 
-    # Create single-value MetricStatsDict (one value per VPN, no cross-machine aggregation)
-    def single_metric(value: float) -> MetricStatsDict:
-        return {
-            "min": value,
-            "average": value,
-            "max": value,
-            "percentiles": {"p25": value, "p50": value, "p75": value},
-        }
-
+    # One value per VPN, no cross-machine aggregation
     return {
-        "total_duration_seconds": single_metric(total),
-        "vpn_installation_seconds": single_metric(installation),
-        "benchmarking_seconds": single_metric(benchmarking),
+        "total_duration_seconds": single_value_stats(total),
+        "vpn_installation_seconds": single_value_stats(installation),
+        "benchmarking_seconds": single_value_stats(benchmarking),
     }
 
 
+@cache
 def extract_tc_stabilization_time(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> float:
     """Extract tc_stabilization duration from timing_breakdown.json."""
-    vpn_dir = bench_dir / vpn_name
-    timing_file = vpn_dir / run_alias / "timing_breakdown.json"
-    if not timing_file.exists():
-        timing_file = vpn_dir / "timing_breakdown.json"
-    if not timing_file.exists():
+    timing = load_timing_breakdown(bench_dir, vpn_name, run_alias)
+    if timing is None:
         return 0.0
+    # Only one phase is the benchmarking phase; stop at the first match
+    benchmarking = next(
+        (p for p in timing.get("phases", []) if p.get("phase") == "benchmarking"),
+        None,
+    )
+    if benchmarking is None:
+        return 0.0
+    return next(
+        (
+            op.get("duration_seconds", 0.0)
+            for op in benchmarking.get("operations", [])
+            if op.get("name") == "tc_stabilization"
+        ),
+        0.0,
+    )
 
-    try:
-        with timing_file.open() as f:
-            data = json.load(f)
-        for phase in data.get("phases", []):
-            if phase.get("phase") == "benchmarking":
-                for op in phase.get("operations", []):
-                    if op.get("name") == "tc_stabilization":
-                        return op.get("duration_seconds", 0.0)
-    except (json.JSONDecodeError, OSError):
-        pass
-    return 0.0
+
+# JSON files in a run directory that are not test results and carry no test meta
+NON_TEST_JSON_FILES = frozenset(
+    {
+        "tc_settings.json",
+        "timing_breakdown.json",
+        "connection_timings.json",
+        "reboot_connection_timings.json",
+    }
+)
 
 
+@cache
 def extract_test_metadata_timings(
     bench_dir: Path, vpn_name: str, run_alias: str
 ) -> tuple[float, float, float]:
     """Extract timing sums from all test metadata.
 
+    Cached because aggregate_timing_data and aggregate_time_breakdown both need
+    the sums of the same VPN run.
+
     Returns (vpn_restart_sum, connectivity_wait_sum, test_duration_sum)
     """
-    vpn_run_dir = bench_dir / vpn_name / run_alias
-    if not vpn_run_dir.exists():
+    listing = list_run_dir(bench_dir / vpn_name / run_alias)
+    if listing is None:
         return 0.0, 0.0, 0.0
 
     total_restart = 0.0
     total_wait = 0.0
     total_duration = 0.0
-    skip_files = {
-        "tc_settings.json",
-        "timing_breakdown.json",
-        "connection_timings.json",
-        "reboot_connection_timings.json",
-    }
 
-    # Scan machine directories for test JSON files
-    for machine_dir in vpn_run_dir.iterdir():
-        if not machine_dir.is_dir():
-            continue
-        for test_file in machine_dir.glob("*.json"):
-            if test_file.name in skip_files:
-                continue
-            try:
-                with test_file.open() as f:
-                    data = json.load(f)
-                meta = data.get("meta", {})
-                total_restart += meta.get("vpn_restart_duration_seconds", 0.0)
-                total_wait += meta.get("connectivity_wait_duration_seconds", 0.0)
-                total_duration += meta.get("duration_seconds", 0.0)
-            except (json.JSONDecodeError, OSError):
-                pass
-
-    # Also check run-level files (parallel_tcp_iperf3.json)
-    for test_file in vpn_run_dir.glob("*.json"):
-        if test_file.name in skip_files:
+    # Machine-level test files, then run-level ones (parallel_tcp_iperf3.json)
+    for test_file in listing.all_paths():
+        if test_file.name in NON_TEST_JSON_FILES:
             continue
         try:
-            with test_file.open() as f:
-                data = json.load(f)
+            data = read_json_file(test_file)
             meta = data.get("meta", {})
             total_restart += meta.get("vpn_restart_duration_seconds", 0.0)
             total_wait += meta.get("connectivity_wait_duration_seconds", 0.0)
@@ -1439,11 +1538,16 @@ def extract_test_metadata_timings(
 
 def aggregate_time_breakdown(
     bench_dir: Path,
-    vpn_dirs: list[Path],
+    vpn_names: list[str],
     run_alias: str,
     benchmark_stats: dict[str, Any],
+    timing_comparison: dict[str, Any],
 ) -> TimeBreakdownDict:
-    """Aggregate time breakdown across all VPNs for pie chart."""
+    """Aggregate time breakdown across all VPNs for pie chart.
+
+    timing_comparison holds the already computed timing comparison entries of
+    this run alias, keyed by VPN name.
+    """
     total_installation = 0.0
     total_tc_stab = 0.0
     total_test_execution = 0.0
@@ -1452,12 +1556,11 @@ def aggregate_time_breakdown(
     total_benchmarking = 0.0
     total_duration = 0.0
 
-    for vpn_dir in vpn_dirs:
-        vpn_name = vpn_dir.name
-
+    for vpn_name in vpn_names:
         # Get timing data
-        timing_data = aggregate_timing_data(bench_dir, vpn_name, run_alias)
-        if timing_data:
+        timing_entry = timing_comparison.get(vpn_name)
+        if timing_entry:
+            timing_data = timing_entry["data"]
             total_installation += timing_data["vpn_installation_seconds"]["average"]
             total_benchmarking += timing_data["benchmarking_seconds"]["average"]
             total_duration += timing_data["total_duration_seconds"]["average"]
@@ -1495,7 +1598,7 @@ def aggregate_time_breakdown(
 
 
 def generate_cross_profile_tcp_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfileTcpDict | None:
     """Generate cross-profile TCP performance data for visualization.
 
@@ -1504,16 +1607,12 @@ def generate_cross_profile_tcp_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfileTcpDict with tcp and parallel_tcp sections, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Collect data for TCP charts
     tcp_bar3d_data: list[list[float]] = []
     tcp_scatter_data: list[list[float]] = []
@@ -1617,7 +1716,7 @@ def generate_cross_profile_tcp_data(
 
 
 def generate_cross_profile_udp_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfileUdpDict | None:
     """Generate cross-profile UDP performance data for visualization.
 
@@ -1626,16 +1725,12 @@ def generate_cross_profile_udp_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfileUdpDict with heatmap and scatter sections, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Dict-based heatmap data
     throughput: dict[str, dict[str, float]] = {}
     cpu: dict[str, dict[str, float]] = {}
@@ -1712,7 +1807,7 @@ def generate_cross_profile_udp_data(
 
 
 def generate_cross_profile_ping_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfilePingDict | None:
     """Generate cross-profile Ping latency data for visualization.
 
@@ -1721,16 +1816,12 @@ def generate_cross_profile_ping_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfilePingDict with heatmap section, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Dict-based heatmap data
     rtt: dict[str, dict[str, float]] = {}
     packet_loss: dict[str, dict[str, float]] = {}
@@ -1774,7 +1865,7 @@ def generate_cross_profile_ping_data(
 
 
 def generate_cross_profile_qperf_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfileQperfDict | None:
     """Generate cross-profile QUIC/Qperf performance data for visualization.
 
@@ -1783,16 +1874,12 @@ def generate_cross_profile_qperf_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfileQperfDict with heatmap section, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Dict-based heatmap data
     bandwidth: dict[str, dict[str, float]] = {}
     cpu: dict[str, dict[str, float]] = {}
@@ -1836,7 +1923,7 @@ def generate_cross_profile_qperf_data(
 
 
 def generate_cross_profile_video_streaming_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfileVideoStreamingDict | None:
     """Generate cross-profile Video Streaming (RIST) data for visualization.
 
@@ -1845,16 +1932,12 @@ def generate_cross_profile_video_streaming_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfileVideoStreamingDict with heatmap section, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Dict-based heatmap data
     quality: dict[str, dict[str, float]] = {}
     rtt_ms: dict[str, dict[str, float]] = {}
@@ -1896,7 +1979,7 @@ def generate_cross_profile_video_streaming_data(
 
 
 def generate_cross_profile_nix_cache_data(
-    bench_dir: Path, vpn_dirs: list[Path], run_aliases: set[str]
+    bench_dir: Path, vpn_names: list[str], tc_profiles: list[str]
 ) -> CrossProfileNixCacheDict | None:
     """Generate cross-profile Nix Cache data for visualization.
 
@@ -1905,16 +1988,12 @@ def generate_cross_profile_nix_cache_data(
 
     Args:
         bench_dir: Base directory containing benchmark data
-        vpn_dirs: List of VPN directories
-        run_aliases: Set of run aliases (TC profiles like baseline, low_impairment, etc.)
+        vpn_names: Sorted VPN names
+        tc_profiles: Run aliases (TC profiles) in severity order, see sort_tc_profiles
 
     Returns:
         CrossProfileNixCacheDict with heatmap section, or None if no data available
     """
-    # Sort VPN names and TC profiles for consistent ordering
-    vpn_names = sorted([d.name for d in vpn_dirs])
-    tc_profiles = sort_tc_profiles(run_aliases)
-
     # Dict-based heatmap data
     mean_seconds: dict[str, dict[str, float]] = {}
     failed: dict[str, list[str]] = {}
@@ -1965,152 +2044,101 @@ def aggregate_benchmark_stats(
 ) -> BenchmarkStatsDict | None:
     """Aggregate benchmark statistics for a VPN including test durations and failure rates."""
 
-    def zero_metric() -> MetricStatsDict:
-        return {
-            "min": 0.0,
-            "average": 0.0,
-            "max": 0.0,
-            "percentiles": {"p25": 0.0, "p50": 0.0, "p75": 0.0},
-        }
+    def extract_duration_and_retries_from_raw_files(
+        test_filename: str,
+    ) -> tuple[MetricStatsDict, int]:
+        """Extract duration stats and total retries from raw test files' meta fields.
 
-    def extract_duration(comparison: dict[str, Any], vpn: str) -> MetricStatsDict:
-        """Extract duration from comparison data if available."""
-        entry = comparison.get(vpn, {})
-        if entry.get("status") == "success" and "data" in entry:
-            duration = entry["data"].get("duration_seconds")
-            if duration:
-                return duration
-        return zero_metric()
-
-    def extract_nix_cache_duration(
-        comparison: dict[str, Any], vpn: str
-    ) -> MetricStatsDict:
-        """Extract Nix cache duration (uses mean_seconds field)."""
-        entry = comparison.get(vpn, {})
-        if entry.get("status") == "success" and "data" in entry:
-            # Nix cache uses mean_seconds for the fetch duration
-            mean_seconds = entry["data"].get("mean_seconds")
-            if mean_seconds:
-                return mean_seconds
-        return zero_metric()
-
-    def extract_duration_from_raw_files(test_filename: str) -> MetricStatsDict:
-        """Extract duration from raw test files' meta.duration_seconds field."""
-        vpn_dir = bench_dir / vpn_name / run_alias
-        if not vpn_dir.exists():
-            return zero_metric()
+        Retries are test_attempts - 1, summed across machines.
+        """
+        listing = list_run_dir(bench_dir / vpn_name / run_alias)
+        if listing is None:
+            return single_value_stats(0.0), 0
 
         durations: list[float] = []
-        for machine_dir in sorted(vpn_dir.iterdir()):
-            if not machine_dir.is_dir():
-                continue
-            test_file = machine_dir / test_filename
-            if not test_file.exists():
-                continue
+        total_retries = 0
+        for test_file in listing.machine_paths(test_filename):
             try:
-                with test_file.open("r") as f:
-                    data = json.load(f)
-                    # Extract duration regardless of success/failure status
-                    # Duration is tracked even for failed tests
-                    meta = data.get("meta", {})
-                    duration = meta.get("duration_seconds")
-                    if duration is not None:
-                        durations.append(float(duration))
-            except (json.JSONDecodeError, OSError, ValueError):
+                data = read_json_file(test_file)
+            except (json.JSONDecodeError, OSError):
                 continue
+            # Extract duration and retries regardless of success/failure status
+            # Both are tracked even for failed tests
+            meta = data.get("meta", {})
+            test_attempts = meta.get("test_attempts", 1)
+            # Retries = attempts - 1 (first attempt is not a retry)
+            if test_attempts > 1:
+                total_retries += test_attempts - 1
+            duration = meta.get("duration_seconds")
+            if duration is not None:
+                try:
+                    durations.append(float(duration))
+                except ValueError:
+                    continue
 
         if not durations:
-            return zero_metric()
+            return single_value_stats(0.0), total_retries
 
-        # Aggregate durations into MetricStatsDict
+        # Aggregate durations into MetricStatsDict; once sorted, min and max
+        # are the ends of the list and need no further scans
         durations.sort()
         avg = sum(durations) / len(durations)
-        n = len(durations)
-
-        def percentile(data: list[float], p: float) -> float:
-            idx = int(p * (n - 1))
-            return data[idx] if n > 0 else 0.0
 
-        return {
-            "min": min(durations),
+        duration_stats: MetricStatsDict = {
+            "min": durations[0],
             "average": avg,
-            "max": max(durations),
+            "max": durations[-1],
             "percentiles": {
                 "p25": percentile(durations, 0.25),
                 "p50": percentile(durations, 0.50),
                 "p75": percentile(durations, 0.75),
             },
         }
-
-    def extract_retries_from_raw_files(test_filename: str) -> int:
-        """Extract total retries (test_attempts - 1) from raw test files, summed across machines."""
-        vpn_dir = bench_dir / vpn_name / run_alias
-        if not vpn_dir.exists():
-            return 0
-
-        total_retries = 0
-        for machine_dir in sorted(vpn_dir.iterdir()):
-            if not machine_dir.is_dir():
-                continue
-            test_file = machine_dir / test_filename
-            if not test_file.exists():
-                continue
-            try:
-                with test_file.open("r") as f:
-                    data = json.load(f)
-                    meta = data.get("meta", {})
-                    test_attempts = meta.get("test_attempts", 1)
-                    # Retries = attempts - 1 (first attempt is not a retry)
-                    if test_attempts > 1:
-                        total_retries += test_attempts - 1
-            except (json.JSONDecodeError, OSError, ValueError):
-                continue
-
-        return total_retries
-
-    # Extract duration from raw files for all tests
-    # This works for both successful and failed tests since meta.duration_seconds
-    # is recorded regardless of test outcome
-    tcp_duration = extract_duration_from_raw_files("tcp_iperf3.json")
-    udp_duration = extract_duration_from_raw_files("udp_iperf3.json")
-    parallel_tcp_duration = extract_duration_from_raw_files("parallel_tcp_iperf3.json")
-    ping_duration = extract_duration_from_raw_files("ping.json")
-    qperf_duration = extract_duration_from_raw_files("qperf.json")
-    video_duration = extract_duration_from_raw_files("rist_stream.json")
-    nix_cache_duration = extract_duration_from_raw_files("nix_cache.json")
-
-    # Extract retry counts from raw files
-    tcp_retries = extract_retries_from_raw_files("tcp_iperf3.json")
-    udp_retries = extract_retries_from_raw_files("udp_iperf3.json")
-    parallel_tcp_retries = extract_retries_from_raw_files("parallel_tcp_iperf3.json")
-    ping_retries = extract_retries_from_raw_files("ping.json")
-    qperf_retries = extract_retries_from_raw_files("qperf.json")
-    video_retries = extract_retries_from_raw_files("rist_stream.json")
-    nix_cache_retries = extract_retries_from_raw_files("nix_cache.json")
+        return duration_stats, total_retries
+
+    # Extract durations and retry counts from raw files for all tests, reading
+    # each file once. This works for both successful and failed tests since
+    # meta.duration_seconds and meta.test_attempts are recorded regardless of
+    # test outcome
+    tcp_duration, tcp_retries = extract_duration_and_retries_from_raw_files(
+        "tcp_iperf3.json"
+    )
+    udp_duration, udp_retries = extract_duration_and_retries_from_raw_files(
+        "udp_iperf3.json"
+    )
+    parallel_tcp_duration, parallel_tcp_retries = (
+        extract_duration_and_retries_from_raw_files("parallel_tcp_iperf3.json")
+    )
+    ping_duration, ping_retries = extract_duration_and_retries_from_raw_files(
+        "ping.json"
+    )
+    qperf_duration, qperf_retries = extract_duration_and_retries_from_raw_files(
+        "qperf.json"
+    )
+    video_duration, video_retries = extract_duration_and_retries_from_raw_files(
+        "rist_stream.json"
+    )
+    nix_cache_duration, nix_cache_retries = extract_duration_and_retries_from_raw_files(
+        "nix_cache.json"
+    )
 
     # Count successes and failures across all test types
-    test_comparisons = [
-        ("tcp", tcp_comparison),
-        ("udp", udp_comparison),
-        ("ping", ping_comparison),
-        ("qperf", qperf_comparison),
-        ("video", video_comparison),
-        ("nix_cache", nix_cache_comparison),
-        ("parallel_tcp", parallel_tcp_comparison),
+    statuses = [
+        comparison[vpn_name].get("status")
+        for comparison in (
+            tcp_comparison,
+            udp_comparison,
+            ping_comparison,
+            qperf_comparison,
+            video_comparison,
+            nix_cache_comparison,
+            parallel_tcp_comparison,
+        )
+        if vpn_name in comparison
     ]
-
-    total_tests = 0
-    successful_tests = 0
-    failed_tests = 0
-
-    for _test_name, comparison in test_comparisons:
-        if vpn_name in comparison:
-            total_tests += 1
-            entry = comparison[vpn_name]
-            if entry.get("status") == "success":
-                successful_tests += 1
-            else:
-                failed_tests += 1
+    total_tests = len(statuses)
+    successful_tests = statuses.count("success")
+    failed_tests = total_tests - successful_tests
 
     # Calculate success rate
     success_rate = (successful_tests / total_tests * 100) if total_tests > 0 else 0.0
@@ -2137,6 +2165,111 @@ def aggregate_benchmark_stats(
     }
 
 
+# --- Per-Test Comparison ---
+
+AggregateFn = Callable[[Path, str, str], Mapping[str, Any] | None]
+ErrorFn = Callable[[Path, str, str, str], dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class TestComparisonSpec:
+    """How to build and save the cross-VPN comparison of one test type."""
+
+    report_file: str  # Filename in the run comparison directory
+    label: str  # Human readable name for logging
+    aggregate_fn: AggregateFn
+    error_fn: ErrorFn
+    test_file: str  # Raw test result filename
+    # Test name for check_duration_consistency, None to skip the check
+    duration_label: str | None = None
+
+
+TEST_COMPARISON_SPECS: tuple[TestComparisonSpec, ...] = (
+    TestComparisonSpec(
+        "ping.json", "ping", aggregate_ping_data, get_vpn_error_for_test, "ping.json"
+    ),
+    TestComparisonSpec(
+        "qperf.json",
+        "qperf",
+        aggregate_qperf_data,
+        get_vpn_error_for_test,
+        "qperf.json",
+    ),
+    TestComparisonSpec(
+        "video_streaming.json",
+        "video streaming",
+        aggregate_rist_data,
+        get_vpn_error_for_test,
+        "rist_stream.json",
+    ),
+    TestComparisonSpec(
+        "tcp_iperf3.json",
+        "TCP iperf3",
+        aggregate_tcp_iperf_data,
+        get_vpn_error_for_test,
+        "tcp_iperf3.json",
+        duration_label="TCP iperf3",
+    ),
+    TestComparisonSpec(
+        "udp_iperf3.json",
+        "UDP iperf3",
+        aggregate_udp_iperf_data,
+        get_vpn_error_for_test,
+        "udp_iperf3.json",
+        duration_label="UDP iperf3",
+    ),
+    TestComparisonSpec(
+        "nix_cache.json",
+        "Nix Cache",
+        aggregate_nix_cache_data,
+        get_vpn_error_for_test,
+        "nix_cache.json",
+    ),
+    TestComparisonSpec(
+        "parallel_tcp_iperf3.json",
+        "Parallel TCP",
+        aggregate_parallel_tcp_data,
+        get_vpn_error_for_run_level_test,
+        "parallel_tcp_iperf3.json",
+        duration_label="Parallel TCP iperf3",
+    ),
+)
+
+
+def build_test_comparison(
+    bench_dir: Path,
+    vpn_names: list[str],
+    run_alias: str,
+    spec: TestComparisonSpec,
+) -> tuple[dict[str, Any], int, int]:
+    """Build the comparison entries (success or error) of one test for all VPNs.
+
+    Returns (comparison, success_count, error_count)
+    """
+    comparison: dict[str, Any] = {}
+    success_count = 0
+    error_count = 0
+    for vpn_name in vpn_names:
+        data = spec.aggregate_fn(bench_dir, vpn_name, run_alias)
+        if data:
+            comparison[vpn_name] = {"status": "success", "data": data}
+            success_count += 1
+            continue
+
+        # Check if there are any error files
+        error_info = spec.error_fn(bench_dir, vpn_name, run_alias, spec.test_file)
+        if error_info:
+            comparison[vpn_name] = {
+                "status": "error",
+                "error_type": error_info["error_type"],
+                "error": error_info["error"],
+                "machine": error_info["machine"],
+            }
+            error_count += 1
+
+    return comparison, success_count, error_count
+
+
 # --- Main Generation Function ---
 
 
@@ -2153,35 +2286,45 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
     """
     log.info(f"Generating comparison data from {bench_dir}")
 
+    # Benchmark results may have changed since the last generation
+    clear_caches()
+
     general_dir = bench_dir / "General"
     comparison_dir = general_dir / "comparison"
 
     # Find all VPN directories (exclude General)
-    vpn_dirs = [d for d in bench_dir.iterdir() if d.is_dir() and d.name != "General"]
+    with os.scandir(bench_dir) as it:
+        vpn_names = [
+            entry.name for entry in it if entry.name != "General" and entry.is_dir()
+        ]
 
-    if not vpn_dirs:
+    if not vpn_names:
         log.warning("No VPN directories found in bench directory")
         return
 
     # Find all run aliases (TC profiles) across all VPNs
     run_aliases: set[str] = set()
-    for vpn_dir in vpn_dirs:
-        for subdir in vpn_dir.iterdir():
-            if subdir.is_dir():
-                # Check if this is a run alias directory (contains machine subdirs)
-                has_machine_dirs = any(
-                    d.is_dir() and not d.name.endswith(".json")
-                    for d in subdir.iterdir()
-                    if d.is_dir()
-                )
-                if has_machine_dirs:
-                    run_aliases.add(subdir.name)
+    for vpn_name in vpn_names:
+        vpn_dir = bench_dir / vpn_name
+        with os.scandir(vpn_dir) as it:
+            subdirs = [entry.name for entry in it if entry.is_dir()]
+        for subdir in subdirs:
+            if subdir in run_aliases:
+                # Already known; the aggregators list it when they need it
+                continue
+            # Check if this is a run alias directory (contains machine subdirs).
+            # The listing is cached, so the aggregators reuse this walk.
+            listing = list_run_dir(vpn_dir / subdir)
+            if listing is not None and any(
+                not machine.endswith(".json") for machine in listing.machines
+            ):
+                run_aliases.add(subdir)
 
     if not run_aliases:
         log.warning("No benchmark runs found")
         return
 
-    log.info(f"Found VPNs: {[d.name for d in vpn_dirs]}")
+    log.info(f"Found VPNs: {vpn_names}")
     log.info(f"Found run aliases: {run_aliases}")
 
     # Generate comparison data for each run alias (TC profile)
@@ -2191,233 +2334,47 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
         run_comparison_dir = comparison_dir / run_alias
         run_comparison_dir.mkdir(parents=True, exist_ok=True)
 
-        # Aggregate ping data (including errors)
-        ping_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            ping_data = aggregate_ping_data(bench_dir, vpn_dir.name, run_alias)
-            if ping_data:
-                ping_comparison[vpn_dir.name] = {"status": "success", "data": ping_data}
-            else:
-                # Check if there are any error files
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "ping.json"
-                )
-                if error_info:
-                    ping_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if ping_comparison:
-            save_bench_report(run_comparison_dir, ping_comparison, "ping.json")
-            success_count = sum(
-                1 for v in ping_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(ping_comparison) - success_count
-            log.info(
-                f"  Saved ping comparison ({success_count} success, {error_count} errors)"
-            )
-
-        # Aggregate qperf data (including errors)
-        qperf_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            qperf_data = aggregate_qperf_data(bench_dir, vpn_dir.name, run_alias)
-            if qperf_data:
-                qperf_comparison[vpn_dir.name] = {
-                    "status": "success",
-                    "data": qperf_data,
-                }
-            else:
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "qperf.json"
+        # Read each VPN's result files in one batch, then build the per-test
+        # comparisons and the per-VPN timing data concurrently
+        with ThreadPoolExecutor(max_workers=len(TEST_COMPARISON_SPECS)) as executor:
+            list(
+                executor.map(
+                    preload_run_dir,
+                    [bench_dir / vpn_name / run_alias for vpn_name in vpn_names],
                 )
-                if error_info:
-                    qperf_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if qperf_comparison:
-            save_bench_report(run_comparison_dir, qperf_comparison, "qperf.json")
-            success_count = sum(
-                1 for v in qperf_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(qperf_comparison) - success_count
-            log.info(
-                f"  Saved qperf comparison ({success_count} success, {error_count} errors)"
             )
-
-        # Aggregate RIST data (including errors)
-        rist_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            rist_data = aggregate_rist_data(bench_dir, vpn_dir.name, run_alias)
-            if rist_data:
-                rist_comparison[vpn_dir.name] = {"status": "success", "data": rist_data}
-            else:
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "rist_stream.json"
+            futures = [
+                executor.submit(
+                    build_test_comparison, bench_dir, vpn_names, run_alias, spec
                 )
-                if error_info:
-                    rist_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if rist_comparison:
-            save_bench_report(
-                run_comparison_dir, rist_comparison, "video_streaming.json"
-            )
-            success_count = sum(
-                1 for v in rist_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(rist_comparison) - success_count
-            log.info(
-                f"  Saved video streaming comparison ({success_count} success, {error_count} errors)"
-            )
-
-        # Aggregate TCP iperf3 data (including errors)
-        tcp_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            tcp_data = aggregate_tcp_iperf_data(bench_dir, vpn_dir.name, run_alias)
-            if tcp_data:
-                tcp_comparison[vpn_dir.name] = {"status": "success", "data": tcp_data}
-            else:
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "tcp_iperf3.json"
-                )
-                if error_info:
-                    tcp_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if tcp_comparison:
-            save_bench_report(run_comparison_dir, tcp_comparison, "tcp_iperf3.json")
-            check_duration_consistency(tcp_comparison, "TCP iperf3")
-            success_count = sum(
-                1 for v in tcp_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(tcp_comparison) - success_count
-            log.info(
-                f"  Saved TCP iperf3 comparison ({success_count} success, {error_count} errors)"
-            )
-
-        # Aggregate UDP iperf3 data (including errors)
-        udp_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            udp_data = aggregate_udp_iperf_data(bench_dir, vpn_dir.name, run_alias)
-            if udp_data:
-                udp_comparison[vpn_dir.name] = {"status": "success", "data": udp_data}
-            else:
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "udp_iperf3.json"
-                )
-                if error_info:
-                    udp_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if udp_comparison:
-            save_bench_report(run_comparison_dir, udp_comparison, "udp_iperf3.json")
-            check_duration_consistency(udp_comparison, "UDP iperf3")
-            success_count = sum(
-                1 for v in udp_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(udp_comparison) - success_count
-            log.info(
-                f"  Saved UDP iperf3 comparison ({success_count} success, {error_count} errors)"
+                for spec in TEST_COMPARISON_SPECS
+            ]
+            timing_results = executor.map(
+                aggregate_timing_data,
+                [bench_dir] * len(vpn_names),
+                vpn_names,
+                [run_alias] * len(vpn_names),
             )
 
-        # Aggregate Nix Cache data (including errors)
-        nix_cache_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            nix_cache_data = aggregate_nix_cache_data(
-                bench_dir, vpn_dir.name, run_alias
-            )
-            if nix_cache_data:
-                nix_cache_comparison[vpn_dir.name] = {
-                    "status": "success",
-                    "data": nix_cache_data,
-                }
-            else:
-                error_info = get_vpn_error_for_test(
-                    bench_dir, vpn_dir.name, run_alias, "nix_cache.json"
-                )
-                if error_info:
-                    nix_cache_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if nix_cache_comparison:
-            save_bench_report(
-                run_comparison_dir, nix_cache_comparison, "nix_cache.json"
-            )
-            success_count = sum(
-                1 for v in nix_cache_comparison.values() if v.get("status") == "success"
-            )
-            error_count = len(nix_cache_comparison) - success_count
-            log.info(
-                f"  Saved Nix Cache comparison ({success_count} success, {error_count} errors)"
-            )
+        test_comparisons: dict[str, dict[str, Any]] = {}
+        for spec, future in zip(TEST_COMPARISON_SPECS, futures, strict=True):
+            comparison, success_count, error_count = future.result()
+            test_comparisons[spec.report_file] = comparison
+            if not comparison:
+                continue
 
-        # Aggregate Parallel TCP data (including errors)
-        parallel_tcp_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            parallel_tcp_data = aggregate_parallel_tcp_data(
-                bench_dir, vpn_dir.name, run_alias
-            )
-            if parallel_tcp_data:
-                parallel_tcp_comparison[vpn_dir.name] = {
-                    "status": "success",
-                    "data": parallel_tcp_data,
-                }
-            else:
-                error_info = get_vpn_error_for_run_level_test(
-                    bench_dir, vpn_dir.name, run_alias, "parallel_tcp_iperf3.json"
-                )
-                if error_info:
-                    parallel_tcp_comparison[vpn_dir.name] = {
-                        "status": "error",
-                        "error_type": error_info["error_type"],
-                        "error": error_info["error"],
-                        "machine": error_info["machine"],
-                    }
-
-        if parallel_tcp_comparison:
-            save_bench_report(
-                run_comparison_dir, parallel_tcp_comparison, "parallel_tcp_iperf3.json"
-            )
-            check_duration_consistency(parallel_tcp_comparison, "Parallel TCP iperf3")
-            success_count = sum(
-                1
-                for v in parallel_tcp_comparison.values()
-                if v.get("status") == "success"
-            )
-            error_count = len(parallel_tcp_comparison) - success_count
+            save_bench_report(run_comparison_dir, comparison, spec.report_file)
+            if spec.duration_label is not None:
+                check_duration_consistency(comparison, spec.duration_label)
             log.info(
-                f"  Saved Parallel TCP comparison ({success_count} success, {error_count} errors)"
+                f"  Saved {spec.label} comparison ({success_count} success, {error_count} errors)"
             )
 
         # Aggregate timing data
         timing_comparison: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
-            timing_data = aggregate_timing_data(bench_dir, vpn_dir.name, run_alias)
+        for vpn_name, timing_data in zip(vpn_names, timing_results, strict=True):
             if timing_data:
-                timing_comparison[vpn_dir.name] = {
+                timing_comparison[vpn_name] = {
                     "status": "success",
                     "data": timing_data,
                 }
@@ -2430,21 +2387,21 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
         # Aggregate benchmark stats (test durations and failure rates)
         benchmark_stats: dict[str, Any] = {}
-        for vpn_dir in vpn_dirs:
+        for vpn_name in vpn_names:
             stats = aggregate_benchmark_stats(
                 bench_dir,
-                vpn_dir.name,
+                vpn_name,
                 run_alias,
-                tcp_comparison,
-                udp_comparison,
-                ping_comparison,
-                qperf_comparison,
-                rist_comparison,
-                nix_cache_comparison,
-                parallel_tcp_comparison,
+                test_comparisons["tcp_iperf3.json"],
+                test_comparisons["udp_iperf3.json"],
+                test_comparisons["ping.json"],
+                test_comparisons["qperf.json"],
+                test_comparisons["video_streaming.json"],
+                test_comparisons["nix_cache.json"],
+                test_comparisons["parallel_tcp_iperf3.json"],
             )
             if stats:
-                benchmark_stats[vpn_dir.name] = {
+                benchmark_stats[vpn_name] = {
                     "status": "success",
                     "data": stats,
                 }
@@ -2457,7 +2414,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
             # Generate time breakdown for pie chart
             time_breakdown = aggregate_time_breakdown(
-                bench_dir, vpn_dirs, run_alias, benchmark_stats
+                bench_dir, vpn_names, run_alias, benchmark_stats, timing_comparison
             )
             # Pass the dict directly - save_bench_report wraps it with {"status": "success", "data": ...}
             save_bench_report(
@@ -2467,10 +2424,20 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
             )
             log.info("  Saved time breakdown")
 
+        # The cross-profile reports read this run alias through the cached
+        # aggregate_*_data and get_vpn_error_for_* results, so release the
+        # decoded result files before the next run alias
+        _parse_json_file.cache_clear()
+
+    # Sort VPN names and TC profiles once for consistent ordering across all
+    # cross-profile reports
+    sorted_vpn_names = sorted(vpn_names)
+    tc_profiles = sort_tc_profiles(run_aliases)
+
     # Generate cross-profile TCP data for 3D visualization
     # This combines data across all TC profiles for the TCP Cross-Profile dashboard
     cross_profile_tcp = generate_cross_profile_tcp_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_tcp:
         save_bench_report(
@@ -2485,7 +2452,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
     # Generate cross-profile UDP data for visualization
     cross_profile_udp = generate_cross_profile_udp_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_udp:
         save_bench_report(
@@ -2500,7 +2467,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
     # Generate cross-profile Ping data for visualization
     cross_profile_ping = generate_cross_profile_ping_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_ping:
         save_bench_report(
@@ -2515,7 +2482,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
     # Generate cross-profile QUIC/Qperf data for visualization
     cross_profile_qperf = generate_cross_profile_qperf_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_qperf:
         save_bench_report(
@@ -2530,7 +2497,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
     # Generate cross-profile Video Streaming data for visualization
     cross_profile_video = generate_cross_profile_video_streaming_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_video:
         save_bench_report(
@@ -2545,7 +2512,7 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
 
     # Generate cross-profile Nix Cache data for visualization
     cross_profile_nix = generate_cross_profile_nix_cache_data(
-        bench_dir, vpn_dirs, run_aliases
+        bench_dir, sorted_vpn_names, tc_profiles
     )
     if cross_profile_nix:
         save_bench_report(
@@ -2569,4 +2536,5 @@ def generate_comparison_data(bench_dir: Path, clan_dir: Path | None = None) -> N
     else:
         log.debug("Skipping hardware generation - clan_dir not provided")
 
+    clear_caches()
     log.info("Comparison data generation complete")
@@ -1,4 +1,3 @@
-import json
 import traceback
 from collections.abc import Mapping
 from dataclasses import dataclass
@@ -9,6 +8,8 @@ from clan_lib.api import dataclass_to_dict
 from clan_lib.cmd import ClanCmdTimeoutError
 from clan_lib.errors import ClanCmdError, ClanError, CmdOut
 
+from vpn_bench.jsonio import json_dumps
+
 
 class TestMetadataDict(TypedDict, total=False):
     """Metadata about test execution.
@@ -105,5 +106,4 @@ def save_bench_report(
     if metadata:
         result["meta"] = metadata
 
-    with (result_file).open("w") as f:
-        json.dump(result, f, indent=4)
+    result_file.write_bytes(json_dumps(result))
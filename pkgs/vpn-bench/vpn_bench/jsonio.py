@@ -0,0 +1,31 @@
+"""
+JSON encoding and decoding for benchmark reports.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+only need to catch the latter.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Decode a JSON document."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode obj as indented, UTF-8 encoded JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode()